@@ -1,9 +1,43 @@
-import pandas as pd
+import os
+import re
+
+import numpy as np
+
+# Set SHARK_ATTACKS_USE_MODIN=1 to run the cleaning on Modin, which partitions the DataFrame across all 
+# CPU cores. The API is the same, so no other change is needed; the DataFrame passed to 'main_cleaning' 
+# must then be a Modin DataFrame (for example, loaded with 'functions.pd.read_excel').
+if os.environ.get("SHARK_ATTACKS_USE_MODIN") == "1":
+    import modin.pandas as pd
+else:
+    import pandas as pd
+
+# Punctuation characters removed from text columns by 'clean_str_punctuation'.
+PUNCTUATION_PATTERN = r"[¡¿.,!?;]"
+
+
+def as_string(series):
+    """
+    Returns the Series as a pandas string dtype, so that the `.str` methods can be applied to every value.
+
+    Columns that already use a string dtype (for example 'string[pyarrow]', as set by 'main_cleaning') 
+    are returned unchanged, keeping their storage. Any other column is converted with `astype("string")`, 
+    which turns numbers into their text representation and keeps missing values as missing.
+
+    Parameters:
+        series (pandas.Series): The Series to convert.
+
+    Returns:
+        pandas.Series: The Series with a string dtype.
+    """
+    if isinstance(series.dtype, pd.StringDtype):
+        return series
+    return series.astype("string")
+
 
 def rename_cols(df):
     """
     Renames the DataFrame columns to improve clarity and consistency.
-    In this case, the function performs two renaming operations:
+    In this case, the function performs two renaming operations, applied together in a single rename:
 
     1. Renames specific columns, such as 'Unnamed: 11' to 'fatal' and 'Species ' to 'species'. 
        The 'fatal' column will be our reference point for identifying fatal injuries.
@@ -18,11 +52,15 @@ def rename_cols(df):
         pandas.DataFrame: The DataFrame with renamed columns.
     """
     
+    # Convert the column names to lowercase and replace spaces with underscores, keeping only the ones that change.
+    new_names = {col: col.lower().replace(" ", "_") for col in df.columns}
+    new_names = {old: new for old, new in new_names.items() if old != new}
+
     # Rename specific columns for clarity
-    df.rename(columns={"Unnamed: 11": "fatal", "Species ": "species"}, inplace=True)
-    
-    # Convert the rest of the column names to lowercase and replace spaces with underscores.
-    df.rename(columns=lambda x: x.lower().replace(" ", "_"), inplace=True)
+    new_names.update({"Unnamed: 11": "fatal", "Species ": "species"})
+
+    # Apply all the renames at once
+    df.rename(columns=new_names, inplace=True)
     
     return df
 
@@ -39,7 +77,10 @@ def remove_nulls(df):
     Returns:
         pandas.DataFrame: The modified DataFrame, without rows that have missing values in key columns.
     """
-    df = df.dropna(subset=['country','name', 'sex', 'age', 'fatal'])
+    # Combine the non-null masks of the key columns and take the matching rows in a single step.
+    key_cols = ['country', 'name', 'sex', 'age', 'fatal']
+    mask = np.logical_and.reduce([df[col].notna().to_numpy() for col in key_cols])
+    df = df.take(np.flatnonzero(mask))
     return df
 
 
@@ -56,11 +97,30 @@ def change_float_to_int(df):
     Returns:
         pandas.DataFrame: The modified DataFrame with float64 columns converted to integers.
     """
-    df = df.apply(lambda x: x.fillna(0).astype(int) if x.dtype == 'float64' else x)
+    # Cast all float64 columns together as a single block instead of column by column.
+    float_cols = df.select_dtypes(include=['float64']).columns
+    if len(float_cols):
+        df[float_cols] = df[float_cols].fillna(0).to_numpy(dtype=np.int64)
     return df
 
 
-def remove_small_reps(df):
+def strip_text_columns(df):
+    """
+    Removes unnecessary leading and trailing spaces from the values of every string-type column.
+
+    Parameters:
+        df (pandas.DataFrame): The DataFrame to process.
+
+    Returns:
+        pandas.DataFrame: The DataFrame with the text values stripped.
+    """
+    for x in df.columns:
+        if pd.api.types.infer_dtype(df[x], skipna=True) == "string":  # If the column is of string type, remove leading and trailing spaces.
+            df[x] = df[x].str.strip()
+    return df
+
+
+def remove_small_reps(df, counts=None):
     """
     Removes small representations from each column, keeping only those that have at least 30 occurrences.
     This function reviews all columns and focuses on string-type columns.
@@ -69,17 +129,22 @@ def remove_small_reps(df):
     it filters rows in each column, retaining only those that appear at least 30 times in the column.
     This is useful for removing low-representation values that might skew the analysis.
 
+    When the data is cleaned in chunks, the occurrences must be counted over the whole dataset rather 
+    than over each chunk, so they can be passed in with 'counts'.
+
     Parameters:
         df (pandas.DataFrame): The DataFrame to process.
+        counts (dict, optional): The number of occurrences of each value, as a pandas.Series per column. 
+            If not given, the occurrences are counted in 'df'.
 
     Returns:
         pandas.DataFrame: The DataFrame with small representations removed and text formatting corrected.
     """
+    df = strip_text_columns(df)
     for x in df.columns:
-        if df[x].dtype == "str":  # If the column is of string type, remove leading and trailing spaces.
-            df[x] = df[x].str.strip()
-        # Filter the column to keep only values that appear at least 30 times.
-        df[x] = df[x].loc[df[x].isin(df[x].value_counts()[lambda x: x >= 30].index)]
+        col_counts = df[x].value_counts() if counts is None else counts[x]
+        # Keep only values that appear at least 30 times in the column; the rest become missing values.
+        df[x] = df[x].where(df[x].map(col_counts) >= 30)
     return df
 
 
@@ -88,9 +153,10 @@ def clean_str_punctuation(df):
     Cleans by removing punctuation, adjusting white spaces, and applying title case to text strings. 
     This function is used in columns such as 'country', 'state', and 'location'.
 
-    First, a translation table is created to remove common punctuation characters like commas, periods, 
-    exclamation marks, and question marks. Then, the function iterates over each column in the DataFrame, 
-    and if the column is of string type, it performs the transformations.
+    The common punctuation characters to remove, like commas, periods, exclamation marks, and question 
+    marks, are defined once in 'PUNCTUATION_PATTERN' and removed with a regular expression, which runs 
+    natively on Arrow-backed string columns. Then, the function iterates over the text columns of the 
+    DataFrame and performs the transformations once per column, keeping the original column order.
 
     Parameters:
         df (pandas.DataFrame): The DataFrame to clean.
@@ -98,20 +164,9 @@ def clean_str_punctuation(df):
     Returns:
         pandas.DataFrame: The DataFrame with formatted text strings and no punctuation.
     """
-    # Define the punctuation characters to be removed.
-    mytable = str.maketrans('', '', '¡¿.,!?;')
-    
-    # Iterate through each column and apply the cleaning only to 'object' type (text) columns.
-    for x in df.columns:
-        if df[x].dtype == "object":  # If the column is of string type.
-            df[x] = df[x].str.strip().str.title().str.translate(mytable)
-    
-    # Create a subset of string-type columns and apply the same cleaning.
-    df_clean = df.select_dtypes(include=['object'])
-    df_clean = df_clean.apply(lambda x: x.str.strip().str.title().str.translate(mytable))
-    
-    # Replace the original columns with the cleaned ones.
-    df = df.drop(df_clean.columns, axis=1).join(df_clean)
+    # Apply the cleaning once, in place, only to text columns.
+    for x in df.select_dtypes(include=['object', 'string']).columns:
+        df[x] = df[x].str.strip().str.title().str.replace(PUNCTUATION_PATTERN, '', regex=True)
     
     return df
 
@@ -121,12 +176,15 @@ def clean_age_column(df):
     Cleans and standardizes the 'age' column, ensuring that numeric values are handled correctly.
 
     The 'age' column may contain values in different formats, including additional text or descriptions. 
-    This function extracts only the numeric part and converts the values to a numeric format (float).
+    This function extracts only the numeric part and converts the values to a nullable numeric format ('Int64', 
+    or 'Float64' when some ages have decimals).
     
-    - Splits the string by spaces and takes the first value (which is usually the age) before any additional text.
-    - Uses `pd.to_numeric` to convert the age to a numeric format. Any value that cannot be converted 
-      (e.g., text) is turned into `NaN`.
-    - Non-convertible or missing values are kept as `NaN` to ensure that the column is suitable for numeric analysis.
+    - Extracts the leading number of the string (which is usually the age), including its decimals, with a 
+      single regular expression, ignoring any additional text that follows it. In 'main_cleaning' this runs 
+      before 'clean_str_punctuation', so the decimal point is still there.
+    - Uses `pd.to_numeric` to convert the age to a nullable numeric format. Any value that cannot be converted 
+      (e.g., text) is turned into a missing value.
+    - Non-convertible or missing values are kept as missing to ensure that the column is suitable for numeric analysis.
 
     Parameters:
         df (pandas.DataFrame): The DataFrame containing the 'age' column to clean.
@@ -134,14 +192,10 @@ def clean_age_column(df):
     Returns:
         pandas.DataFrame: The DataFrame with the 'age' column cleaned and in numeric format.
     """
-    import numpy as np
+    # Extract the leading number (the age) in one vectorized pass, then convert to numeric.
+    age = as_string(df["age"]).str.extract(r"^\s*([0-9]+(?:\.[0-9]+)?)", expand=False)
+    df["age"] = pd.to_numeric(age, errors="coerce")
 
-    # Split the string and take the first part (the age), then convert to numeric.
-    df["age"] = df["age"].str.split(" ").str[0].apply(pd.to_numeric, errors="coerce")
-    
-    # Fill non-convertible values with NaN.
-    df["age"].fillna(value=np.nan, inplace=True)
-    
     return df
 
 
@@ -158,15 +212,17 @@ def clean_fatal_column(df):
        - Ambiguous values such as 'M', 'NQ', and 'UNKNOWN' to 'Unknown'.
     3. Missing or null values in the column are replaced with 'Unknown'.
 
+    The column is converted to a categorical first, so the mapping is only applied once per unique 
+    value and each row is remapped through its integer category code. The result is kept as a 
+    categorical column.
+
     Parameters:
         df (pandas.DataFrame): The DataFrame containing the 'fatal' column to clean.
 
     Returns:
         pandas.DataFrame: The DataFrame with the 'fatal' column cleaned and standardized.
     """
-    
-    # Clean white spaces, convert to uppercase, and replace specific values
-    df["fatal"] = df["fatal"].str.strip().str.upper().replace({
+    mapping = {
         'Y': 'Yes',  # Convert 'Y' to 'Yes'
         'N': 'No',  # Convert 'N' to 'No'
         'F': 'Yes',  # Convert 'F' to 'Yes' (presumably indicates fatality)
@@ -175,79 +231,40 @@ def clean_fatal_column(df):
         'M': 'Unknown',  # Assume 'M' means 'Unknown'
         'NQ': 'Unknown',  # Assume 'NQ' means 'Unknown'
         'Y X 2': 'Yes'  # Assume 'Y X 2' means 'Yes'
-    })
-    
-    # Fill missing values with 'Unknown'
-    df['fatal'] = df['fatal'].fillna('Unknown')
-    
-    return df
+    }
 
+    # Clean white spaces and convert to uppercase, storing the result as a categorical
+    fatal = as_string(df["fatal"]).str.strip().str.upper().astype("category")
 
-def standardize_time(time_str):
-    """
-    Standardizes a time string to a 24-hour format.
+    # Map each unique value once; values outside the mapping are kept as they are
+    labels = pd.Index([mapping.get(c, c) for c in fatal.cat.categories], dtype=object)
+    categories = labels.append(pd.Index(['Unknown'], dtype=object)).unique()
+    # The last entry is the code of 'Unknown', so missing values (code -1) are remapped to it. This also
+    # works when the column has no values at all and there are no categories to remap.
+    remap = np.append(categories.get_indexer(labels), categories.get_loc('Unknown'))
 
-    Time data can come in a variety of formats, such as 'dawn', 'afternoon', or '6:30 PM'.
-    This function converts all possible formats to a uniform representation in a 24-hour format, 
-    making it easier to analyze the times of the attacks. If the time is not available, 
-    a default value of '12:00' is used.
+    # Gather the new codes per row
+    new_codes = remap[fatal.cat.codes.to_numpy()]
+    fatal = pd.Categorical.from_codes(new_codes, categories=categories)
 
-    Parameters:
-        time_str (str or int): The string representing the time to standardize.
+    df["fatal"] = pd.Series(fatal, index=df.index).cat.remove_unused_categories()
+
+    return df
 
-    Returns:
-        str: The standardized time string in a 24-hour format.
-    """
-    if pd.isna(time_str):
-        return '12:00'
-    if isinstance(time_str, int):
-        time_str = str(time_str)
-    time_str = time_str.strip().lower()
-    
-    # Handle different descriptions of time
-    if 'early' in time_str or 'dawn' in time_str or 'before' in time_str:
-        return '06:00'
-    if 'morning' in time_str:
-        return '09:00'
-    if 'midday' in time_str or 'noon' in time_str:
-        return '12:00'
-    if 'afternoon' in time_str:
-        return '15:00'
-    if 'evening' in time_str or 'dusk' in time_str or 'sunset' in time_str:
-        return '18:00'
-    if 'night' in time_str or 'midnight' in time_str:
-        return '23:00'
-    
-    # Attempt to parse different time formats
-    try:
-        time_str = time_str.replace('h', ':').replace(' ', '')
-        if '-' in time_str:
-            time_str = time_str.split('-')[0].strip()
-        if ':' in time_str:
-            return pd.to_datetime(time_str, format='%H:%M', errors='coerce').strftime('%H:%M')
-        if ' ' in time_str:
-            time_str = time_str.split()[0]
-        time_str = time_str.replace('j', '').replace('"', '').replace('pm', '').replace('am', '')
-        if len(time_str) == 4:
-            return f'{time_str[:2]}:{time_str[2:]}'
-        if len(time_str) == 3:
-            return f'0{time_str[0]}:{time_str[1:]}'
-        return '12:00'  # Default value if conversion fails
-    except:
-        return '12:00'
-    
 
 def clean_time_column(df):
     """
-    Cleans and standardizes the 'time' column in the DataFrame by applying the 'standardize_time' 
-    function to each value.
+    Cleans and standardizes the 'time' column in the DataFrame to a 24-hour format.
 
     The 'time' column may contain data in various formats (such as descriptive text or hours in 
-    different formats). This function ensures that all time values are in a uniform format 
-    (for example, in 24-hour format).
-    
-    It uses the 'standardize_time' function to convert values like 'morning', '6:30 PM', or 'dusk' 
-    into a consistent time format.
+    different formats). This function converts all values to a uniform representation in a 24-hour 
+    format ('HH:MM'), making it easier to analyze the times of the attacks. All the steps are applied 
+    to the whole column at once:
+
+    - Descriptions such as 'dawn', 'morning', 'afternoon' or 'dusk' are assigned a representative hour.
+    - Values containing ':' (or 'h', as in '14h00') are parsed as hours and minutes.
+    - Values made of 3 or 4 digits, such as '630' or '1630', are split into hours and minutes.
+    - Any value that cannot be converted, or is not available, gets a default value of '12:00'.
 
     Parameters:
         df (pandas.DataFrame): The DataFrame containing the 'time' column to clean.
@@ -255,7 +272,43 @@ def clean_time_column(df):
     Returns:
         pandas.DataFrame: The DataFrame with the 'time' column cleaned and standardized.
     """
-    df["time"] = df["time"].apply(standardize_time)  # Applies time standardization
+    time = as_string(df["time"]).str.strip().str.lower()
+
+    # Handle different descriptions of time, in order of priority
+    conditions = [
+        time.str.contains('early|dawn|before', na=False),
+        time.str.contains('morning', na=False),
+        time.str.contains('midday|noon', na=False),
+        time.str.contains('afternoon', na=False),
+        time.str.contains('evening|dusk|sunset', na=False),
+        time.str.contains('night|midnight', na=False),
+    ]
+    choices = ['06:00', '09:00', '12:00', '15:00', '18:00', '23:00']
+    described = pd.Series(np.select(conditions, choices, default=None), index=df.index, dtype=object)
+
+    # Attempt to parse hours written as '6:30', '14h00' or '1630-1700', removing spaces and anything after '-'
+    clock = time.str.replace('h', ':', regex=False).str.replace(r'(?s) |-.*', '', regex=True).str.strip()
+    has_colon = clock.str.contains(':', regex=False, na=False)
+
+    # Split hours and minutes (ASCII digits only), keep only valid times and pad them to 'HH:MM'
+    # (no per-value datetime parsing)
+    hours_minutes = clock.where(has_colon).str.extract(r'^([0-9]{1,2}):([0-9]{1,2})$')
+    hours, minutes = hours_minutes[0], hours_minutes[1]
+    hours_ok = pd.to_numeric(hours, errors='coerce') < 24
+    minutes_ok = pd.to_numeric(minutes, errors='coerce') < 60
+    valid = (hours_ok & minutes_ok).fillna(False).astype(bool)
+    parsed = (hours.str.zfill(2) + ':' + minutes.str.zfill(2)).where(valid)
+
+    # Hours written only with digits, such as '630' or '1630'
+    digits = clock.str.replace(r'j|"|pm|am', '', regex=True)
+    length = digits.str.len()
+    four_digits = digits.str[:2] + ':' + digits.str[2:]
+    three_digits = '0' + digits.str[0] + ':' + digits.str[1:]
+
+    numeric = parsed.where(has_colon, four_digits.where(length == 4, three_digits.where(length == 3)))
+
+    # Default value if conversion fails
+    df["time"] = described.fillna(numeric.astype(object)).fillna('12:00')
     return df
 
 
@@ -269,110 +322,151 @@ closest species name.
 """
 
 
-def clean_species(species_str, valid_species):
+def clean_species_column(df, valid_species):
     """
     Cleans and standardizes species names in the 'species' column by comparing with a list of 
     valid species.
 
-    The function aims to normalize the value of the 'species' column by comparing each value with a 
-    predefined list of valid species. If the value matches (case insensitive) one of the valid 
-    species, the corresponding species name is returned. If no match is found, the value 'Unknown' 
-    is assigned.
+    The function aims to normalize the value of the 'species' column by looking for any of the 
+    valid species names inside each value (case insensitive). If a match is found, the corresponding 
+    species name is returned. If no match is found, the value 'Unknown' is assigned.
 
-    - Strips any leading or trailing whitespace from the string.
-    - If the species is in the list of valid species, the species name is returned.
+    - All valid species are lowercased and combined into a single regular expression, with longer 
+      names first so that, for example, 'Great white shark' is preferred over 'White shark'.
+    - The column is lowercased once and the pattern is applied to it at once with `str.extract`.
     - If there is no match or the value is null, 'Unknown' is assigned.
 
     Parameters:
-        species_str (str): The species name to clean.
-        valid_species (set): A set of valid species for comparison.
+        df (pandas.DataFrame): The DataFrame containing the 'species' column.
+        valid_species (set): Set of valid species for cleaning.
 
     Returns:
-        str: The cleaned species name, or 'Unknown' if no match is found.
+        pandas.DataFrame: The DataFrame with the 'species' column cleaned.
     """
-    if pd.isna(species_str):
-        return 'Unknown'
-    species_str = str(species_str).strip()
-    # Extract only the main species name if it matches the valid ones
-    for name in valid_species:
-        if name.lower() in species_str.lower():
-            return name
-    return 'Unknown'  # Default value if no match is found
+    if not valid_species:
+        df['species'] = 'Unknown'
+        return df
 
+    # Map each lowercase name back to the valid species name
+    canonical = {name.lower(): name for name in valid_species}
 
-def clean_species_column(df, valid_species):
+    # Build a single alternation of all lowercase names, longest names first
+    names = sorted(canonical, key=len, reverse=True)
+    pattern = re.compile('(' + '|'.join(map(re.escape, names)) + ')')
+
+    # Lowercase the column once and match it against the lowercase names
+    lowered = as_string(df['species']).str.lower()
+    matches = lowered.str.extract(pattern, expand=False)
+    df['species'] = matches.map(canonical).fillna('Unknown')
+    return df
+
+
+def clean_pdf_column(df):
     """
-    Applies the species cleaning using the 'clean_species' function to ensure all species 
-    are valid and consistent.
+    Cleans and standardizes the PDF file names in the 'pdf' column by removing any non-alphanumeric 
+    characters, except for periods, underscores, and dashes.
+
+    This function ensures that the PDF file names in the DataFrame are cleaned and standardized, 
+    removing special characters that could cause issues. Numbers are converted to strings, and empty 
+    or missing values are assigned 'Unknown'. The cleaning is done with a single regular expression 
+    over the whole column.
 
     Parameters:
-        df (pandas.DataFrame): The DataFrame containing the 'species' column.
-        valid_species (set): Set of valid species for cleaning.
+        df (pandas.DataFrame): The DataFrame containing the 'pdf' column.
 
     Returns:
-        pandas.DataFrame: The DataFrame with the 'species' column cleaned.
+        pandas.DataFrame: The DataFrame with the 'pdf' column cleaned.
     """
-    df['species'] = df['species'].apply(lambda x: clean_species(x, valid_species))
+    pdf = as_string(df['pdf']).str.strip()
+    # Remove non-alphanumeric (ASCII) characters except periods, underscores, and dashes
+    pdf = pdf.str.replace(r'[^A-Za-z0-9._-]', '', regex=True)
+    df['pdf'] = pdf.mask(pdf.isna() | pdf.eq(''), 'Unknown')
     return df
 
 
-def clean_pdf(pdf_str):
+def drop_useless_columns(df):
     """
-    Cleans a string representing a PDF file by removing any non-alphanumeric characters, 
-    except for periods, underscores, and dashes.
+    Drops unnecessary or irrelevant columns from the DataFrame.
 
-    This function ensures that the PDF file names in the DataFrame are cleaned and standardized, 
-    removing special characters that could cause issues. If the value is a number, it converts 
-    it to a string. If the string is empty or invalid, 'Unknown' is assigned.
+    In this case, the columns 'original_order', 'unnamed:_21', and 'unnamed:_22' are removed because 
+    they do not provide relevant information for the analysis. This function ensures that the DataFrame 
+    remains clean and contains only useful columns. Columns that are not present are ignored.
 
     Parameters:
-        pdf_str (str or int): The value of the 'pdf' column to clean.
+        df (pandas.DataFrame): The DataFrame from which the columns will be dropped.
 
     Returns:
-        str: The cleaned PDF file name or 'Unknown' if the value is invalid.
+        pandas.DataFrame: The DataFrame without the unnecessary columns.
     """
-    if pd.isna(pdf_str):
-        return 'Unknown'
-    if isinstance(pdf_str, int):
-        pdf_str = str(pdf_str)
-    pdf_str = str(pdf_str).strip()
-    # Remove non-alphanumeric characters except periods, underscores, and dashes
-    pdf_str = ''.join(c for c in pdf_str if c.isalnum() or c in ['.', '_', '-'])
-    return pdf_str if pdf_str else 'Unknown'
+    df = df.drop(columns=["original_order", "unnamed:_21", "unnamed:_22"], errors="ignore")
+    return df
 
 
-def clean_pdf_column(df):
+def prepare_columns(df):
     """
-    Applies the 'clean_pdf' function to the 'pdf' column to clean and standardize the PDF file names.
+    Prepares the columns and rows of the DataFrame before their values are cleaned.
 
-    Iterates through the 'pdf' column of the DataFrame, cleaning each value to ensure that the file names 
-    are in a proper format for handling.
+    - Renames columns for better readability.
+    - Drops unnecessary columns, so that the following steps do not process them.
+    - Converts text columns to Arrow-backed strings ('string[pyarrow]'), so every '.str' operation 
+      runs on Arrow buffers. Columns that mix text with other values (numbers, dates) are kept as they are.
+    - Removes missing values in key columns.
+    - Converts numeric columns from floats to integers.
 
     Parameters:
-        df (pandas.DataFrame): The DataFrame containing the 'pdf' column.
+        df (pandas.DataFrame): The DataFrame to prepare.
 
     Returns:
-        pandas.DataFrame: The DataFrame with the 'pdf' column cleaned.
+        pandas.DataFrame: The prepared DataFrame.
     """
-    df['pdf'] = df['pdf'].apply(clean_pdf)
+    df = rename_cols(df)  # Rename columns
+    # Drop unnecessary columns before any cleaning. This returns a new DataFrame, so the steps below
+    # do not modify the caller's data (only the column names are changed in place).
+    df = drop_useless_columns(df)
+
+    # Store text columns as Arrow-backed strings. Columns that mix text with numbers or dates are left
+    # as they are, so those values are not turned into text by the cast.
+    text_cols = [x for x in df.select_dtypes(include=['object']).columns
+                 if pd.api.types.infer_dtype(df[x], skipna=True) == "string"]
+    df[text_cols] = df[text_cols].astype('string[pyarrow]')
+
+    df = remove_nulls(df)  # Remove missing values in key columns
+    df = change_float_to_int(df)  # Convert floats to integers
     return df
 
 
-def drop_useless_columns(df):
+def clean_values(df, valid_species):
     """
-    Drops unnecessary or irrelevant columns from the DataFrame.
+    Cleans and normalizes the values of the DataFrame once its columns have been prepared.
 
-    In this case, the columns 'original_order', 'unnamed:_21', and 'unnamed:_22' are removed because 
-    they do not provide relevant information for the analysis. This function ensures that the DataFrame 
-    remains clean and contains only useful columns.
+    - Cleans the 'age' column, keeping decimal ages.
+    - Cleans punctuation in various text columns.
+    - Normalizes and cleans the 'fatal', 'time', 'species' and 'pdf' columns.
+    - Converts low-cardinality columns ('fatal', 'sex', 'species', 'country', 'state' and 'location') to categoricals.
 
     Parameters:
-        df (pandas.DataFrame): The DataFrame from which the columns will be dropped.
+        df (pandas.DataFrame): The DataFrame to clean.
+        valid_species (set): Set of valid species for the 'species' column.
 
     Returns:
-        pandas.DataFrame: The DataFrame without the unnecessary columns.
+        pandas.DataFrame: The DataFrame with cleaned values.
     """
-    df = df.drop(["original_order", "unnamed:_21", "unnamed:_22"], axis=1)
+    # Every step below modifies the columns of the same DataFrame in place and passes it on to the next one
+    df = (
+        df
+        .pipe(clean_age_column)  # Clean the age column, before punctuation removal drops its decimal point
+        .pipe(clean_str_punctuation)  # Clean punctuation in text
+        .pipe(clean_fatal_column)  # Clean the 'fatal' column
+        .pipe(clean_time_column)  # Standardize the time column
+        .pipe(clean_species_column, valid_species)  # Clean the 'species' column
+        .pipe(clean_pdf_column)  # Clean the 'pdf' column
+    )
+
+    # Store low-cardinality columns as categoricals. Group them with `observed=True` to only get the 
+    # combinations present in the data.
+    for x in ['fatal', 'sex', 'species', 'country', 'state', 'location']:
+        if x in df:
+            df[x] = df[x].astype('category')
     return df
 
 
@@ -384,12 +478,14 @@ def main_cleaning(df_main, valid_species):
     It performs the following tasks:
     
     - Renames columns for better readability.
+    - Drops unnecessary columns, so that the following steps do not process them.
+    - Converts text-only columns to Arrow-backed strings ('string[pyarrow]').
     - Removes duplicates and missing values in key columns.
     - Converts numeric columns from floats to integers.
     - Removes categories with low representation.
     - Cleans punctuation in various text columns.
     - Normalizes and cleans values.
-    - Drops unnecessary columns.
+    - Converts low-cardinality columns ('fatal', 'sex', 'species', 'country', 'state' and 'location') to categoricals.
 
     Parameters:
         df_main (pandas.DataFrame): The main DataFrame to clean.
@@ -398,16 +494,147 @@ def main_cleaning(df_main, valid_species):
     Returns:
         pandas.DataFrame: The cleaned DataFrame, ready for analysis.
     """
-    df_main = rename_cols(df_main)  # Rename columns
-    df_main = remove_nulls(df_main)  # Remove duplicates
-    df_main = change_float_to_int(df_main)  # Convert floats to integers
+    df_main = prepare_columns(df_main)  # Rename, drop and convert columns, remove missing values
     df_main = remove_small_reps(df_main)  # Remove small representations
-    df_main = clean_str_punctuation(df_main)  # Clean punctuation in text
-    df_main = clean_age_column(df_main)  # Clean the age column
-    df_main = clean_fatal_column(df_main)  # Clean the 'fatal' column
-    df_main = clean_time_column(df_main)  # Standardize the time column
-    df_main = clean_species_column(df_main, valid_species)  # Clean the 'species' column
-    df_main = clean_pdf_column(df_main)  # Clean the 'pdf' column
-    df_main = drop_useless_columns(df_main)  # Drop unnecessary columns
+    df_main = clean_values(df_main, valid_species)  # Clean and normalize the values
     
-    return df_main
\ No newline at end of file
+    return df_main
+
+
+def infer_csv_column_types(path, batch_size=65536):
+    """
+    Finds the type of every column of a CSV file by reading it whole, in batches, with `pyarrow.dataset`.
+
+    Arrow guesses the type of each CSV column from the first block of the file only, so a column that 
+    holds numbers at the start and text further down (such as 'Age' or 'Time' in GSAF5) would make the 
+    reading fail. Instead, every column is read as text, and only the columns whose values can all be 
+    converted to numbers are typed as numeric, as `pandas.read_csv` does.
+
+    Parameters:
+        path (str): Path to the CSV file (or directory of files).
+        batch_size (int): Maximum number of rows read at a time.
+
+    Returns:
+        dict: The Arrow type of each column: `pyarrow.float64()` for numeric columns and `pyarrow.string()` 
+            for the rest.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.dataset as ds
+
+    # Read every column as text; empty fields are read as missing values.
+    names = ds.dataset(path, format='csv').schema.names
+    text_format = ds.CsvFileFormat(convert_options=pa_csv.ConvertOptions(
+        column_types={name: pa.string() for name in names}, strings_can_be_null=True))
+
+    numeric = dict.fromkeys(names, True)
+    for batch in ds.dataset(path, format=text_format).to_batches(batch_size=batch_size):
+        df = batch.to_pandas()
+        for name in names:
+            if numeric[name]:
+                values = df[name].dropna()
+                numeric[name] = bool(pd.to_numeric(values, errors='coerce').notna().all())
+
+    return {name: pa.float64() if numeric[name] else pa.string() for name in names}
+
+
+def parquet_schema(df):
+    """
+    Builds the Arrow schema used to write the batches cleaned by 'clean_file_in_chunks' to Parquet.
+
+    The types pandas gives to a cleaned batch depend on the values of that batch, so they are not the 
+    same for every batch: categorical codes use the smallest integer width that fits the categories 
+    of the batch, the 'age' column is 'Int64' or 'Float64' depending on whether it has decimals, and a 
+    text column with only missing values has no type at all. The schema uses a type that fits every batch:
+
+    - Categorical columns: dictionary of strings with int32 codes.
+    - Integer columns ('year', for example): int64.
+    - Other numeric columns, including nullable ones such as 'age': float64.
+    - Any other column: string.
+
+    Parameters:
+        df (pandas.DataFrame): A batch cleaned like 'main_cleaning' does.
+
+    Returns:
+        pyarrow.Schema: The schema to write every batch with.
+    """
+    import pyarrow as pa
+
+    fields = []
+    for x in df.columns:
+        dtype = df[x].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            arrow_type = pa.dictionary(pa.int32(), pa.large_string())
+        elif pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, np.dtype):
+            arrow_type = pa.int64()
+        elif pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+            arrow_type = pa.float64()
+        else:
+            arrow_type = pa.large_string()
+        fields.append(pa.field(x, arrow_type))
+    return pa.schema(fields)
+
+
+def clean_file_in_chunks(path, valid_species, output_path, file_format='csv', batch_size=65536):
+    """
+    Runs the same cleaning as 'main_cleaning' on a file that may not fit in memory, writing the result 
+    to a Parquet file.
+
+    The file is read in batches of rows with `pyarrow.dataset`, so the rows themselves are never all in 
+    memory at once. However, the number of occurrences of every value of every column is kept for the 
+    whole file, because 'remove_small_reps' filters all columns. Memory use therefore also grows with the 
+    number of distinct values in the file, which for near-unique columns such as 'name', 'date', 
+    'case_number' or 'pdf' is close to the number of rows (and adding each batch to these counts takes 
+    time proportional to the distinct values seen so far). The file is read in several passes:
+
+    1. For CSV files, a first pass finds the type of every column with 'infer_csv_column_types', so that 
+       columns mixing numbers and text are read as text in every batch.
+    2. The next pass prepares each batch and counts the occurrences of every value, so that small 
+       representations are removed with the counts of the whole file, not of each batch.
+    3. The last pass prepares and cleans each batch and appends it to the Parquet file.
+
+    Parameters:
+        path (str): Path to the file (or directory of files) to clean.
+        valid_species (set): Set of valid species for the 'species' column.
+        output_path (str): Path of the Parquet file to write.
+        file_format (str): Format of the input file, as understood by `pyarrow.dataset` (e.g. 'csv', 'parquet').
+        batch_size (int): Maximum number of rows read at a time.
+
+    Returns:
+        None
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    # Read CSV columns with the types found over the whole file, and empty fields as missing values,
+    # as 'pandas.read_csv' does.
+    if file_format == 'csv':
+        column_types = infer_csv_column_types(path, batch_size)
+        file_format = ds.CsvFileFormat(convert_options=pa_csv.ConvertOptions(
+            column_types=column_types, strings_can_be_null=True))
+    dataset = ds.dataset(path, format=file_format)
+
+    # First pass: count the occurrences of each value over the whole file.
+    counts = {}
+    for batch in dataset.to_batches(batch_size=batch_size):
+        df = strip_text_columns(prepare_columns(batch.to_pandas()))
+        for x in df.columns:
+            batch_counts = df[x].value_counts()
+            counts[x] = batch_counts if x not in counts else counts[x].add(batch_counts, fill_value=0)
+
+    # Second pass: clean each batch and write it to the Parquet file.
+    # Every batch is written with the same schema, built from the first one with 'parquet_schema'.
+    writer = None
+    try:
+        for batch in dataset.to_batches(batch_size=batch_size):
+            df = prepare_columns(batch.to_pandas())
+            df = clean_values(remove_small_reps(df, counts), valid_species)
+            if writer is None:
+                schema = parquet_schema(df)
+                writer = pq.ParquetWriter(output_path, schema)
+            writer.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False))
+    finally:
+        if writer is not None:
+            writer.close()
@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+
+from functions import clean_fatal_column, clean_file_in_chunks, clean_time_column, main_cleaning
+
+VALID_SPECIES = {'White shark', 'Tiger shark'}
+
+
+def make_raw_frame(n_rows=40000):
+    """
+    Builds a raw DataFrame with the columns used by 'main_cleaning'. The 'Age' column only holds numbers
+    in the first rows and text ('teen') in the last ones, well after the first block Arrow uses to guess
+    types when the frame is written to CSV.
+    """
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'Country': rng.choice(['USA', 'AUSTRALIA', None], n_rows),
+        'Name': rng.choice(['male', 'female'], n_rows),
+        'Sex': rng.choice(['M', 'F'], n_rows),
+        'Age': rng.integers(10, 60, n_rows).astype(object),
+        'Unnamed: 11': rng.choice(['Y', 'N', 'UNKNOWN'], n_rows),
+        'Time': rng.choice(['Morning', '14h00', '1630'], n_rows),
+        'Species ': rng.choice(['White shark', 'tiger shark 3m', 'Invalid'], n_rows),
+        'pdf': rng.choice(['1900.01.01-a.pdf', 'ND-0001.pdf'], n_rows),
+        'original order': rng.integers(0, 100, n_rows),
+    })
+    df.loc[n_rows - 50:, 'Age'] = 'teen'
+    return df
+
+
+def make_raw_csv(path, n_rows=40000):
+    """Writes the frame built by 'make_raw_frame' to a CSV file."""
+    make_raw_frame(n_rows).to_csv(path, index=False)
+
+
+def as_comparable(df):
+    """Returns the values of the DataFrame as plain Python objects, with None for missing values."""
+    df = df.reset_index(drop=True).astype(object)
+    return df.where(df.notna(), None)
+
+
+def test_clean_file_in_chunks_reads_columns_whose_type_changes_after_first_block(tmp_path):
+    csv_path = tmp_path / 'raw.csv'
+    parquet_path = tmp_path / 'clean.parquet'
+    make_raw_csv(csv_path)
+
+    clean_file_in_chunks(str(csv_path), VALID_SPECIES, str(parquet_path), batch_size=5000)
+
+    chunked = pd.read_parquet(parquet_path)
+    in_memory = main_cleaning(pd.read_csv(csv_path), VALID_SPECIES)
+    assert list(chunked.columns) == list(in_memory.columns)
+    assert as_comparable(chunked).equals(as_comparable(in_memory))
+    assert chunked['age'].isna().sum() == in_memory['age'].isna().sum() > 0
+
+
+def test_clean_fatal_column_with_only_missing_values():
+    df = pd.DataFrame({'fatal': [None, np.nan, None]})
+
+    result = clean_fatal_column(df)
+
+    assert result['fatal'].tolist() == ['Unknown'] * 3
+
+
+def test_main_cleaning_on_fewer_rows_than_the_small_representation_threshold(tmp_path):
+    csv_path = tmp_path / 'raw.csv'
+    make_raw_csv(csv_path, n_rows=25)
+
+    result = main_cleaning(pd.read_csv(csv_path), VALID_SPECIES)
+
+    assert len(result) > 0
+    assert result['fatal'].tolist() == ['Unknown'] * len(result)
+
+
+def test_clean_time_column_with_non_ascii_digits():
+    for dtype in [object, 'string[pyarrow]']:
+        df = pd.DataFrame({'time': pd.Series(['０６:３０', '٣:٣٠', '6:30', '1630'], dtype=dtype)})
+
+        result = clean_time_column(df)
+
+        assert result['time'].tolist() == ['12:00', '12:00', '06:30', '16:30']
+
+
+def test_clean_file_in_chunks_when_later_batches_need_wider_types(tmp_path):
+    csv_path = tmp_path / 'raw.csv'
+    parquet_path = tmp_path / 'clean.parquet'
+    df = make_raw_frame(20000)
+    df['Country'] = 'USA'  # Keep every row, so each location keeps its 30 occurrences
+    # No location in the first batch, then 500 locations of 30 rows each (more than 127 per batch).
+    df['Location'] = [None] * 5000 + [f'Beach {i}' for i in range(500) for _ in range(30)]
+    # Decimal ages only after the first batch
+    df.loc[15000:15099, 'Age'] = '2.5'
+    df.to_csv(csv_path, index=False)
+
+    clean_file_in_chunks(str(csv_path), VALID_SPECIES, str(parquet_path), batch_size=5000)
+
+    chunked = pd.read_parquet(parquet_path)
+    in_memory = main_cleaning(pd.read_csv(csv_path), VALID_SPECIES)
+    assert chunked['location'].nunique() == 500
+    assert (chunked['age'] == 2.5).sum() == 100
+    assert as_comparable(chunked).equals(as_comparable(in_memory))